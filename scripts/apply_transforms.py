@@ -7,19 +7,36 @@ This script applies various transformations to the imported repositories:
 2. API drift simulation with v1/v2 versions
 3. Wrapper/indirection layers
 4. Code duplication with modifications
+
+Note: Numba/JIT is deliberately not used in this module. The work here is
+filesystem orchestration plus string/regex transforms and JSON I/O — there
+is no numeric hot loop to compile, nopython mode supports none of the APIs
+involved, and JIT warm-up would exceed the runtime it could save. CPU-bound
+wins belong to the regex/mmap/parallel-I/O paths below instead.
 """
 
 import os
+import re
 import json
+import mmap
+import fcntl
 import random
 import argparse
 import shutil
 import logging
 import subprocess
+import concurrent.futures
+from string import Template
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import yaml
 
+# orjson is much faster for large rename maps; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import the real transformation engine
 try:
     from transform_engine import FileIndex, SymbolRenamer, APIDriftSimulator, LanguageValidator
@@ -31,6 +48,246 @@ except ImportError:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Compiled once at import so worker processes inherit them via fork instead of
+# recompiling per file. A single alternation makes one pass over the buffer
+# instead of one pass per substitution.
+_LEGACY_SUBS = {
+    b'"INFO"': b'"DEBUG"',
+    b"'error'": b"'warn'",
+    b'1024': b'1000',
+    b'60': b'65',
+}
+_LEGACY_PATTERN = re.compile(rb'"INFO"|\'error\'|\b1024\b|\b60\b')
+
+
+def _legacy_sub(match) -> bytes:
+    return _LEGACY_SUBS[match.group(0)]
+
+
+def _dump_json(obj: Any, path: str) -> None:
+    """Atomically serialize obj to path, preferring orjson's C serializer.
+
+    Writes to a hidden temp file, fsyncs, then renames over the target so
+    downstream mtime-based caches never observe a half-written file.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(obj, indent=2).encode('utf-8')
+
+    directory, name = os.path.split(path)
+    tmp_path = f"{directory}{os.sep}.tmp-{name}" if directory else f".tmp-{name}"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.rename(tmp_path, path)
+
+
+# Wrapper templates built once at import; Template.substitute avoids
+# re-escaping the literal braces an f-string rebuild would need
+_GO_WRAPPER_TMPL = Template('''// Auto-generated wrapper for $symbol
+package main
+
+import (
+    "log"
+    "time"
+)
+
+// ${symbol}Wrapper provides logging and monitoring for $symbol
+func ${symbol}Wrapper(args ...interface{}) interface{} {
+    start := time.Now()
+    log.Printf("Calling $symbol at %v", start)
+
+    // TODO: Call original $symbol function
+    result := $symbol(args...)
+
+    duration := time.Since(start)
+    log.Printf("$symbol completed in %v", duration)
+
+    return result
+}
+
+// Logging wrapper interface
+type ${symbol}Logger interface {
+    Log(message string)
+    Wrap(fn func(...interface{}) interface{}) func(...interface{}) interface{}
+}
+''')
+
+_PY_WRAPPER_TMPL = Template('''"""Auto-generated wrapper for $symbol"""
+
+import logging
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+class ${symbol}Wrapper:
+    """Logging and monitoring wrapper for $symbol"""
+
+    def __init__(self, original_func: Callable):
+        self.original_func = original_func
+        self.call_count = 0
+
+    def __call__(self, *args, **kwargs) -> Any:
+        self.call_count += 1
+        start_time = time.time()
+
+        logger.info(f"Calling $symbol (call #{self.call_count})")
+
+        try:
+            result = self.original_func(*args, **kwargs)
+            duration = time.time() - start_time
+            logger.info(f"$symbol completed in {duration:.3f}s")
+            return result
+        except Exception as e:
+            duration = time.time() - start_time
+            logger.error(f"$symbol failed after {duration:.3f}s: {e}")
+            raise
+
+def create_${symbol_lower}_wrapper(original_func: Callable) -> ${symbol}Wrapper:
+    """Factory function to create wrapper for $symbol"""
+    return ${symbol}Wrapper(original_func)
+''')
+
+
+def _count_files_capped(path: str, cap: int = 100) -> int:
+    """Count files under path, bailing out once the count exceeds cap.
+
+    Uses scandir's cached dirent type info instead of per-entry stat calls,
+    so oversized directories cost O(cap) syscalls instead of O(subtree).
+    """
+    count = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        count += 1
+                        if count > cap:
+                            return count
+        except OSError:
+            continue
+    return count
+
+
+# FICLONE ioctl for reflink copies on btrfs/XFS
+_FICLONE = 0x40049409
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """Real byte copy, staying in the kernel via copy_file_range when possible.
+
+    copy_file_range avoids the userspace 64KB bounce-buffer loop that
+    shutil uses; on failure (cross-device, unsupported fs) fall back to
+    shutil.copy2.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            try:
+                os.unlink(dst)
+            except OSError:
+                pass
+
+    shutil.copy2(src, dst)
+
+
+def _cow_copy(src: str, dst: str) -> None:
+    """Copy-on-write copy function for shutil.copytree.
+
+    Precedence: hardlink (free on the same filesystem), then reflink, then
+    an in-kernel byte copy via _fast_copy.
+    """
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        return
+    except OSError:
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+
+    _fast_copy(src, dst)
+
+
+def _rewrite_one(file_path: str) -> Optional[str]:
+    """Apply the legacy-drift edits to a single duplicated file.
+
+    Module-level so it can be pickled into ProcessPoolExecutor workers.
+    Works on raw bytes to skip the UTF-8 decode/encode round trip.
+    Returns the path if the file was modified, None otherwise.
+    """
+    try:
+        # mmap precheck: scan through the page cache without copying, and
+        # dismiss files that contain no target token and no leading comment
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            try:
+                mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return None  # empty file, nothing to rewrite
+
+            with mm:
+                head = mm[:2]
+                if file_path.endswith('.py'):
+                    gets_header = head[:1] == b'#'
+                else:
+                    gets_header = head in (b'//', b'/*')
+
+                if not gets_header and _LEGACY_PATTERN.search(mm) is None:
+                    return None
+
+                data = mm[:]
+        finally:
+            os.close(fd)
+
+        new_data = _LEGACY_PATTERN.sub(_legacy_sub, data)
+
+        # Add legacy comments, using the comment leader for the file's language
+        if file_path.endswith('.py'):
+            if new_data.startswith(b'#'):
+                new_data = b'# LEGACY VERSION - DO NOT USE\n' + new_data
+        elif new_data.startswith(b'//'):
+            new_data = b'// LEGACY VERSION - DO NOT USE\n' + new_data
+        elif new_data.startswith(b'/*'):
+            new_data = b'/* LEGACY VERSION */\n' + new_data
+
+        if new_data != data:
+            # Break any hardlink left by the CoW duplication so the source
+            # tree keeps its original content
+            os.unlink(file_path)
+            with open(file_path, 'wb') as f:
+                f.write(new_data)
+            return file_path
+
+    except Exception as e:
+        logger.debug(f"Failed to modify {file_path}: {e}")
+
+    return None
+
 
 class LegacyTransformer:
     """Applies real legacy codebase transformations using language-aware parsing."""
@@ -53,10 +310,15 @@ class LegacyTransformer:
         self.validator = LanguageValidator()
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from repos.yaml."""
+        """Load configuration from repos.yaml via an mtime-keyed JSON cache.
+
+        repos.yaml rarely changes, so the parsed document is cached next to
+        it as JSON with the source mtime on the first line; warm runs skip
+        the PyYAML parse entirely.
+        """
+        cache_path = 'repos.yaml.cache.json'
         try:
-            with open('repos.yaml', 'r') as f:
-                return yaml.safe_load(f)
+            mtime = os.stat('repos.yaml').st_mtime_ns
         except FileNotFoundError:
             # Fallback configuration
             return {
@@ -68,6 +330,34 @@ class LegacyTransformer:
                     'duplication_directories': 2
                 }
             }
+
+        try:
+            with open(cache_path, 'rb') as f:
+                first_line, _, payload = f.read().partition(b'\n')
+            if first_line == str(mtime).encode('ascii'):
+                if orjson is not None:
+                    return orjson.loads(payload)
+                return json.loads(payload)
+        except (OSError, ValueError):
+            pass  # stale or corrupt cache; reparse below
+
+        with open('repos.yaml', 'r') as f:
+            config = yaml.safe_load(f)
+
+        # Atomically refresh the cache; best effort only
+        try:
+            if orjson is not None:
+                payload = orjson.dumps(config)
+            else:
+                payload = json.dumps(config).encode('utf-8')
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(str(mtime).encode('ascii') + b'\n' + payload)
+            os.rename(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Failed to write config cache: {e}")
+
+        return config
     
     def apply_all_transforms(self):
         """Apply all transformation types with real implementations."""
@@ -96,8 +386,9 @@ class LegacyTransformer:
         # Find all source repositories
         src_dirs = []
         if os.path.exists('src'):
-            src_dirs = [os.path.join('src', d) for d in os.listdir('src') 
-                       if os.path.isdir(os.path.join('src', d))]
+            with os.scandir('src') as entries:
+                src_dirs = [entry.path for entry in entries
+                            if entry.is_dir(follow_symlinks=False)]
         
         if not src_dirs:
             logger.warning("No source directories found in src/")
@@ -162,137 +453,74 @@ class LegacyTransformer:
             logger.error("File index not built - skipping wrapper layers")
             return
         
-        # Select functions to wrap
-        all_symbols = list(self.file_index.symbols_to_files.keys())
+        # Select functions to wrap by sampling indices into the indexable
+        # symbol view, avoiding a full copy of the key list
+        symbol_list = self.file_index.symbol_list
         wrapper_count = self.config['transforms']['wrapper_layers']
-        
-        if len(all_symbols) == 0:
+
+        if len(symbol_list) == 0:
             logger.warning("No symbols found for wrapper creation")
             return
-        
-        selected_symbols = self.rng.sample(
-            all_symbols, 
-            min(wrapper_count, len(all_symbols))
+
+        selected_indices = self.rng.sample(
+            range(len(symbol_list)),
+            min(wrapper_count, len(symbol_list))
         )
+        selected_symbols = [symbol_list[i] for i in selected_indices]
         
-        files_created = 0
-        
+        # Render all wrapper contents first, then write them in one batch
+        pending_writes = []
         for symbol in selected_symbols:
             try:
-                symbol_files = list(self.file_index.symbols_to_files[symbol])
+                symbol_files = self.file_index.symbol_files(symbol)
                 if not symbol_files:
                     continue
-                
+
                 # Create wrapper in same directory as original
                 original_file = symbol_files[0]
                 file_info = self.file_index.files[original_file]
-                
+
                 if file_info.language in ['go', 'python']:
-                    wrapper_file = self._create_wrapper_file(original_file, symbol, file_info.language)
-                    if wrapper_file:
-                        files_created += 1
-                        self.wrapper_layers[symbol] = {
-                            "original_file": original_file,
-                            "wrapper_file": wrapper_file,
-                            "call_chain": f"caller -> {wrapper_file} -> {original_file}"
-                        }
-                        
+                    original_path = Path(original_file)
+                    wrapper_path = original_path.parent / f"{original_path.stem}_wrapper{original_path.suffix}"
+                    if file_info.language == 'go':
+                        content = self._generate_go_wrapper(symbol, original_path.stem)
+                    else:
+                        content = self._generate_python_wrapper(symbol, original_path.stem)
+                    pending_writes.append((symbol, original_file, str(wrapper_path), content))
+
             except Exception as e:
                 logger.warning(f"Failed to create wrapper for {symbol}: {e}")
-        
+
+        files_created = 0
+        for symbol, original_file, wrapper_file, content in pending_writes:
+            try:
+                fd = os.open(wrapper_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, content.encode('utf-8'))
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                logger.error(f"Failed to create wrapper file {wrapper_file}: {e}")
+                continue
+
+            logger.info(f"Created wrapper: {wrapper_file}")
+            files_created += 1
+            self.wrapper_layers[symbol] = {
+                "original_file": original_file,
+                "wrapper_file": wrapper_file,
+                "call_chain": f"caller -> {wrapper_file} -> {original_file}"
+            }
+
         logger.info(f"Created {files_created} wrapper layers")
-    
-    def _create_wrapper_file(self, original_file: str, symbol: str, language: str) -> str:
-        """Create a wrapper file for a symbol."""
-        original_path = Path(original_file)
-        wrapper_path = original_path.parent / f"{original_path.stem}_wrapper{original_path.suffix}"
-        
-        try:
-            if language == 'go':
-                wrapper_content = self._generate_go_wrapper(symbol, original_path.stem)
-            elif language == 'python':
-                wrapper_content = self._generate_python_wrapper(symbol, original_path.stem)
-            else:
-                return None
-            
-            with open(wrapper_path, 'w') as f:
-                f.write(wrapper_content)
-            
-            logger.info(f"Created wrapper: {wrapper_path}")
-            return str(wrapper_path)
-            
-        except Exception as e:
-            logger.error(f"Failed to create wrapper file {wrapper_path}: {e}")
-            return None
-    
+
     def _generate_go_wrapper(self, symbol: str, original_module: str) -> str:
         """Generate Go wrapper code."""
-        return f'''// Auto-generated wrapper for {symbol}
-package main
+        return _GO_WRAPPER_TMPL.substitute(symbol=symbol)
 
-import (
-    "log"
-    "time"
-)
-
-// {symbol}Wrapper provides logging and monitoring for {symbol}
-func {symbol}Wrapper(args ...interface{{}}) interface{{}} {{
-    start := time.Now()
-    log.Printf("Calling {symbol} at %v", start)
-    
-    // TODO: Call original {symbol} function
-    result := {symbol}(args...)
-    
-    duration := time.Since(start)
-    log.Printf("{symbol} completed in %v", duration)
-    
-    return result
-}}
-
-// Logging wrapper interface
-type {symbol}Logger interface {{
-    Log(message string)
-    Wrap(fn func(...interface{{}}) interface{{}}) func(...interface{{}}) interface{{}}
-}}
-'''
-    
     def _generate_python_wrapper(self, symbol: str, original_module: str) -> str:
         """Generate Python wrapper code."""
-        return f'''"""Auto-generated wrapper for {symbol}"""
-
-import logging
-import time
-from typing import Any, Callable
-
-logger = logging.getLogger(__name__)
-
-class {symbol}Wrapper:
-    """Logging and monitoring wrapper for {symbol}"""
-    
-    def __init__(self, original_func: Callable):
-        self.original_func = original_func
-        self.call_count = 0
-    
-    def __call__(self, *args, **kwargs) -> Any:
-        self.call_count += 1
-        start_time = time.time()
-        
-        logger.info(f"Calling {symbol} (call #{{self.call_count}})")
-        
-        try:
-            result = self.original_func(*args, **kwargs)
-            duration = time.time() - start_time
-            logger.info(f"{symbol} completed in {{duration:.3f}}s")
-            return result
-        except Exception as e:
-            duration = time.time() - start_time
-            logger.error(f"{symbol} failed after {{duration:.3f}}s: {{e}}")
-            raise
-
-def create_{symbol.lower()}_wrapper(original_func: Callable) -> {symbol}Wrapper:
-    """Factory function to create wrapper for {symbol}"""
-    return {symbol}Wrapper(original_func)
-'''
+        return _PY_WRAPPER_TMPL.substitute(symbol=symbol, symbol_lower=symbol.lower())
     
     def apply_duplication(self):
         """Create real code duplication by copying directories with modifications."""
@@ -305,15 +533,20 @@ def create_{symbol.lower()}_wrapper(original_func: Callable) -> {symbol}Wrapper:
             if not os.path.exists(repo_dir):
                 continue
             
-            # Find suitable subdirectories (not too large)
-            subdirs = []
-            for item in os.listdir(repo_dir):
-                item_path = os.path.join(repo_dir, item)
-                if os.path.isdir(item_path) and not item.startswith('.'):
-                    # Check size - don't duplicate huge directories
-                    size = sum(len(files) for _, _, files in os.walk(item_path))
-                    if size < 100:  # Less than 100 files
-                        subdirs.append(item)
+            # Find suitable subdirectories in one scandir pass; is_dir without
+            # following symlinks runs off cached dirent type info, so no stat
+            # per child. Skip huge directories (100+ files).
+            try:
+                with os.scandir(repo_dir) as entries:
+                    subdirs = [
+                        entry.name for entry in entries
+                        if entry.is_dir(follow_symlinks=False)
+                        and not entry.name.startswith('.')
+                        and self._subtree_file_count(entry.path) < 100
+                    ]
+            except OSError as e:
+                logger.warning(f"Failed to scan {repo_dir}: {e}")
+                continue
             
             if not subdirs:
                 continue
@@ -323,14 +556,14 @@ def create_{symbol.lower()}_wrapper(original_func: Callable) -> {symbol}Wrapper:
             dirs_to_duplicate = self.rng.sample(subdirs, dup_count)
             
             for dir_name in dirs_to_duplicate:
-                original = os.path.join(repo_dir, dir_name)
-                duplicate = os.path.join(repo_dir, f"{dir_name}_legacy")
+                original = f"{repo_dir}{os.sep}{dir_name}"
+                duplicate = f"{repo_dir}{os.sep}{dir_name}_legacy"
                 
                 try:
                     if os.path.exists(duplicate):
                         shutil.rmtree(duplicate)
                     
-                    shutil.copytree(original, duplicate)
+                    shutil.copytree(original, duplicate, copy_function=_cow_copy)
                     
                     # Apply small modifications to duplicated files
                     modified_files = self._modify_duplicated_files(duplicate)
@@ -348,46 +581,30 @@ def create_{symbol.lower()}_wrapper(original_func: Callable) -> {symbol}Wrapper:
         
         logger.info(f"Created {duplicated_count} directory duplications")
     
+    def _subtree_file_count(self, item_path: str) -> int:
+        """Look up a subtree's file count from the index, scanning only as fallback."""
+        if self.file_index and item_path in self.file_index.dir_file_count:
+            return self.file_index.dir_file_count[item_path]
+        return _count_files_capped(item_path)
+
     def _modify_duplicated_files(self, duplicate_dir: str) -> List[str]:
-        """Apply small modifications to duplicated files."""
-        modified_files = []
-        
+        """Apply small modifications to duplicated files in parallel."""
+        file_paths = []
         for root, _, files in os.walk(duplicate_dir):
             for filename in files:
                 if filename.endswith(('.go', '.py', '.cpp', '.h')):
-                    file_path = os.path.join(root, filename)
-                    
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                        
-                        # Apply minor modifications
-                        original_content = content
-                        
-                        # Change some string literals
-                        content = content.replace('"INFO"', '"DEBUG"')
-                        content = content.replace("'error'", "'warn'")
-                        
-                        # Add legacy comments
-                        if content.startswith('//') or content.startswith('#'):
-                            content = f"// LEGACY VERSION - DO NOT USE\n{content}"
-                        elif content.startswith('/*'):
-                            content = f"/* LEGACY VERSION */\n{content}"
-                        
-                        # Change some numeric constants slightly  
-                        import re
-                        content = re.sub(r'\b1024\b', '1000', content)
-                        content = re.sub(r'\b60\b', '65', content)
-                        
-                        if content != original_content:
-                            with open(file_path, 'w', encoding='utf-8') as f:
-                                f.write(content)
-                            modified_files.append(file_path)
-                            
-                    except Exception as e:
-                        logger.debug(f"Failed to modify {file_path}: {e}")
-        
-        return modified_files
+                    # f-string join: os.path.join is pure Python and hot here
+                    file_paths.append(f"{root}{os.sep}{filename}")
+
+        if not file_paths:
+            return []
+
+        # Independent per-file rewrites dominated by Python-level string work,
+        # so fan out across processes rather than threads
+        with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(_rewrite_one, file_paths, chunksize=64)
+
+        return [path for path in results if path]
     
     def _validate_transformations(self):
         """Validate that transformations don't break compilation."""
@@ -403,10 +620,12 @@ def create_{symbol.lower()}_wrapper(original_func: Callable) -> {symbol}Wrapper:
         for repo_dir in self.file_index.root_dirs:
             repo_name = os.path.basename(repo_dir)
             
-            # Determine primary language
-            go_files = len(list(Path(repo_dir).rglob("*.go")))
-            py_files = len(list(Path(repo_dir).rglob("*.py")))
-            cpp_files = len(list(Path(repo_dir).rglob("*.cpp")))
+            # Determine primary language from the per-repo histogram built
+            # during indexing — no walk, no list materialization
+            lang_counts = self.file_index.lang_counts.get(repo_dir, {})
+            go_files = lang_counts.get('go', 0)
+            py_files = lang_counts.get('python', 0)
+            cpp_files = lang_counts.get('cpp', 0)
             
             if go_files > max(py_files, cpp_files):
                 success, error = self.validator.validate_go(repo_dir)
@@ -442,35 +661,35 @@ def create_{symbol.lower()}_wrapper(original_func: Callable) -> {symbol}Wrapper:
             }
         }
         
-        with open('transforms/renames.json', 'w') as f:
-            json.dump(self.renames, f, indent=2)
-        
-        with open('transforms/api_migrations.json', 'w') as f:
-            json.dump(self.api_migrations, f, indent=2)
-        
-        with open('transforms/wrapper_layers.json', 'w') as f:
-            json.dump(self.wrapper_layers, f, indent=2)
-        
-        with open('transforms/duplication_map.json', 'w') as f:
-            json.dump(self.duplication_map, f, indent=2)
-        
-        with open('transforms/metadata.json', 'w') as f:
-            json.dump(metadata, f, indent=2)
-        
+        _dump_json(self.renames, 'transforms/renames.json')
+        _dump_json(self.api_migrations, 'transforms/api_migrations.json')
+        _dump_json(self.wrapper_layers, 'transforms/wrapper_layers.json')
+        _dump_json(self.duplication_map, 'transforms/duplication_map.json')
+        _dump_json(metadata, 'transforms/metadata.json')
+
+        # Single bundle so downstream tools do one read instead of four
+        _dump_json({
+            'renames': self.renames,
+            'api_migrations': self.api_migrations,
+            'wrapper_layers': self.wrapper_layers,
+            'duplication_map': self.duplication_map,
+        }, 'transforms/bundle.json')
+
         logger.info("Transformation metadata saved")
         logger.info(f"Summary: {metadata['transforms_applied']}")
 
 
 def main():
-    """Main entry point for applying transformations."""
+    """Main entry point for applying transformations.
+
+    Determinism comes entirely from --seed, which seeds the transformer's
+    private random.Random; no transform consumes interpreter hash ordering.
+    """
     parser = argparse.ArgumentParser(description='Apply legacy codebase transformations')
     parser.add_argument('--seed', type=int, default=42, help='Random seed for deterministic results')
-    
+
     args = parser.parse_args()
-    
-    # Set environment for deterministic execution
-    os.environ['PYTHONHASHSEED'] = '0'
-    
+
     transformer = LegacyTransformer(seed=args.seed)
     transformer.apply_all_transforms()
 
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Compile the YAML task files into an importable Python module.
+
+Writes tasks/_compiled.py containing the parsed task list as a literal,
+keyed on the source files' count and newest mtime. validate_patch.py
+prefers this module over re-parsing the YAML: CPython caches its bytecode
+under __pycache__, so a warm load costs a marshal read instead of N YAML
+parses. Run this after generate_tasks.py (or let validate_patch.py fall
+back to the YAML path when the module is missing or stale).
+"""
+
+import os
+import sys
+import yaml
+import pprint
+import logging
+import argparse
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+_COMPILED_PATH = os.path.join('tasks', '_compiled.py')
+
+
+def scan_task_files(tasks_dir: str = 'tasks'):
+    """Return sorted (path, mtime_ns) pairs for the task YAML files."""
+    try:
+        with os.scandir(tasks_dir) as entries:
+            return sorted(
+                (e.path, e.stat().st_mtime_ns) for e in entries
+                if e.name.endswith('.yaml') and e.is_file(follow_symlinks=False)
+            )
+    except FileNotFoundError:
+        return []
+
+
+def cache_key_for(task_files) -> str:
+    """Cache key shared with validate_patch.py's loader."""
+    return f"{len(task_files)}:{max((mtime for _, mtime in task_files), default=0)}"
+
+
+def build_task_cache(tasks_dir: str = 'tasks') -> int:
+    """Parse the task files and emit tasks/_compiled.py. Returns task count."""
+    task_files = scan_task_files(tasks_dir)
+
+    tasks = []
+    for task_path, _ in task_files:
+        try:
+            with open(task_path, 'rb') as f:
+                tasks.append(yaml.load(f, Loader=_YamlLoader))
+        except Exception as e:
+            logger.error(f"Error loading task {task_path}: {e}")
+
+    source = (
+        '"""Generated by scripts/build_task_cache.py; do not edit."""\n\n'
+        f"CACHE_KEY = {cache_key_for(task_files)!r}\n\n"
+        f"TASKS = {pprint.pformat(tasks, sort_dicts=False)}\n"
+    )
+
+    # Atomic write so a concurrent validator never imports a torn module
+    tmp_path = f"{_COMPILED_PATH}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(source)
+    os.rename(tmp_path, _COMPILED_PATH)
+
+    logger.info(f"Compiled {len(tasks)} tasks into {_COMPILED_PATH}")
+    return len(tasks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile task YAML files into tasks/_compiled.py')
+    parser.add_argument('--tasks-dir', default='tasks', help='Directory containing task YAML files')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.tasks_dir):
+        logger.error(f"Tasks directory not found: {args.tasks_dir}")
+        sys.exit(1)
+
+    build_task_cache(args.tasks_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -7,22 +7,28 @@ using shallow history to keep size manageable.
 """
 
 import os
+import shutil
 import argparse
 import subprocess
 import logging
+import concurrent.futures
 import yaml
 from pathlib import Path
 from typing import Dict, List, Any
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# libyaml's C loader is ~10x faster than the pure-Python parser
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 def load_repository_config(core_only: bool = False) -> List[Dict[str, Any]]:
     """Load repository configuration from repos.yaml."""
     try:
         with open('repos.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
         
         if core_only:
             repos = config.get('core_repos', [])
@@ -81,18 +87,19 @@ def clone_repository(repo_config):
     
     logger.info(f"Cloning {name} from {url}")
     
-    # Create target directory if it doesn't exist
-    Path(folder).mkdir(parents=True, exist_ok=True)
-    
-    # Remove existing directory if present
-    if os.path.exists(folder) and os.listdir(folder):
+    # Ensure only the parent exists and clear any stale checkout; git clone
+    # creates the leaf directory itself, so pre-creating it is wasted work
+    Path(folder).parent.mkdir(parents=True, exist_ok=True)
+    if os.path.exists(folder):
         logger.info(f"Removing existing {folder}")
-        subprocess.run(['rm', '-rf', folder], check=True)
-        Path(folder).mkdir(parents=True, exist_ok=True)
+        shutil.rmtree(folder, ignore_errors=True)
     
-    # Clone with shallow history
+    # Clone with shallow history; single-branch and no-tags skip refs the
+    # corpus never uses, and the blob filter defers any blob not needed for
+    # the tip checkout
     try:
-        cmd = ['git', 'clone', '--depth', str(depth), url, folder]
+        cmd = ['git', 'clone', '--depth', str(depth), '--single-branch',
+               '--filter=blob:none', '--no-tags', url, folder]
         subprocess.run(cmd, check=True, capture_output=True, text=True)
         logger.info(f"Successfully cloned {name}")
     except subprocess.CalledProcessError as e:
@@ -102,21 +109,28 @@ def clone_repository(repo_config):
         raise
 
 
+def validate_import(repo_config):
+    """Validate that a single repository was successfully imported."""
+    folder = repo_config['folder']
+    name = repo_config['name']
+
+    # One scandir covers both the existence and the non-empty check
+    try:
+        with os.scandir(folder) as entries:
+            if next(entries, None) is None:
+                raise ValueError(f"Repository {name} folder is empty at {folder}")
+    except FileNotFoundError:
+        raise ValueError(f"Repository {name} not found at {folder}")
+
+    logger.info(f"✓ {name} imported successfully")
+
+
 def validate_imports(repos):
     """Validate that all repositories were successfully imported."""
     logger.info("Validating imported repositories...")
-    
+
     for repo_config in repos:
-        folder = repo_config['folder']
-        name = repo_config['name']
-        
-        if not os.path.exists(folder):
-            raise ValueError(f"Repository {name} not found at {folder}")
-        
-        if not os.listdir(folder):
-            raise ValueError(f"Repository {name} folder is empty at {folder}")
-        
-        logger.info(f"✓ {name} imported successfully")
+        validate_import(repo_config)
 
 
 def main():
@@ -124,12 +138,17 @@ def main():
     parser = argparse.ArgumentParser(description='Import source repositories for benchmark corpus')
     parser.add_argument('--seed', type=int, default=42, help='Random seed for deterministic results')
     parser.add_argument('--core-only', action='store_true', help='Import only core repositories (for CI)')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='Number of concurrent clones (default: min(8, repo count))')
     
     args = parser.parse_args()
-    
+
+    # Configure logging only when run as a script, so importers stay quiet
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
     # Set environment for deterministic execution
     os.environ['PYTHONHASHSEED'] = '0'
-    
+
     logger.info("Starting repository import process...")
     
     # Load repository configuration
@@ -143,13 +162,17 @@ def main():
     # Ensure src directory exists
     os.makedirs('src', exist_ok=True)
     
-    # Clone each repository
-    for repo_config in repos:
-        clone_repository(repo_config)
-    
-    # Validate all imports
-    validate_imports(repos)
-    
+    # Clone repositories concurrently; each clone is network/disk bound, so
+    # overlapping them collapses total wall time towards the slowest repo.
+    # Validate each repo as its clone finishes, overlapping the validation
+    # stat calls with the tail of still-running clones.
+    jobs = args.jobs or min(8, len(repos))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = {executor.submit(clone_repository, cfg): cfg for cfg in repos}
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+            validate_import(futures[future])
+
     logger.info("Repository import completed successfully!")
 
 
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Long-running patch validation daemon.
+
+validate_patch.py pays full interpreter startup plus yaml and
+scoring_engine import on every invocation, which dominates short
+validations when an orchestrator submits many patches. This daemon
+imports once, then reads one patch path per line on stdin and writes
+one JSON result per line on stdout, so the per-patch cost is just the
+validation itself. Logging goes to stderr; stdout carries only results.
+
+Usage (from the corpus root):
+    python scripts/validate_daemon.py < patch_paths.txt
+or drive it interactively from an orchestrator holding both pipes open.
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+
+from validate_patch import PatchValidator
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def serve(timeout_minutes: int = 30) -> int:
+    """Validate patch paths from stdin until EOF. Returns patches served."""
+    served = 0
+    for line in sys.stdin:
+        patch_file = line.strip()
+        if not patch_file:
+            continue
+
+        if not os.path.exists(patch_file):
+            result = {'error': f'Patch file not found: {patch_file}', 'score': 0}
+        else:
+            validator = PatchValidator(patch_file, timeout_minutes=timeout_minutes)
+            result = validator.validate_and_score()
+        result['patch_file'] = patch_file
+
+        # One compact line per patch so the orchestrator can stream-parse
+        sys.stdout.write(json.dumps(result) + '\n')
+        sys.stdout.flush()
+        served += 1
+
+    logger.info(f"Daemon exiting after {served} patches")
+    return served
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Validate a stream of patch files in one persistent process')
+    parser.add_argument('--timeout', '-t', type=int, default=30,
+                        help='Per-patch timeout in minutes (default: 30)')
+    args = parser.parse_args()
+
+    if not os.path.exists('tasks') or not os.path.exists('src'):
+        logger.error("Must run from benchmark corpus root directory (containing tasks/ and src/)")
+        sys.exit(1)
+
+    serve(timeout_minutes=args.timeout)
+
+
+if __name__ == '__main__':
+    main()
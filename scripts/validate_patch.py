@@ -18,9 +18,22 @@ import argparse
 import time
 import tempfile
 import shutil
-from pathlib import Path
+import importlib.util
 from typing import Dict, List, Any, Tuple
 
+# libyaml's C loader is ~10x faster than the pure-Python parser
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# orjson's C serializer is much faster for large result arrays; fall back
+# to stdlib json when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import the real scoring engine
 try:
     from scoring_engine import ScoringEngine, ScoreResult
@@ -28,6 +41,59 @@ except ImportError:
     logging.error("scoring_engine module not found. Please ensure scoring_engine.py is in the same directory.")
     sys.exit(1)
 
+# Consolidated JSON mirror of the parsed task files, keyed on their
+# mtimes. Lives at the corpus root rather than inside tasks/ because
+# restore_backup relinks tasks/ from a snapshot taken before load_tasks
+# runs — a cache written inside it would be wiped on every restore
+_TASK_CACHE_PATH = 'tasks.cache.json'
+
+# Tasks precompiled into a Python module by scripts/build_task_cache.py;
+# loading it costs one marshal read of the cached bytecode
+_COMPILED_TASKS_PATH = os.path.join('tasks', '_compiled.py')
+
+
+def _load_compiled_tasks(cache_key: str):
+    """Load tasks from the precompiled module, or None if missing/stale."""
+    try:
+        spec = importlib.util.spec_from_file_location('_compiled_tasks', _COMPILED_TASKS_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if module.CACHE_KEY == cache_key:
+            return module.TASKS
+    except (OSError, SyntaxError, AttributeError, ImportError):
+        pass
+    return None
+
+# Task weights from scoring rules (harder tasks worth more), built once
+# instead of per calculate_weighted_score call
+_TASK_WEIGHTS = {
+    'cross_file_reasoning': 1.0,   # baseline
+    'refactor_rename': 1.2,        # requires precision
+    'api_upgrade': 1.5,            # complex coordination
+    'bug_localization': 2.0        # highest difficulty
+}
+
+
+def _dumps_indented(obj) -> bytes:
+    """Serialize obj as indented JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _link_or_copy(src: str, dst: str):
+    """Hardlink src to dst, copying only when linking isn't possible.
+
+    Snapshots built from links cost one directory entry per file instead
+    of a data copy. Both git apply and patch replace files via
+    rename, so patched files get fresh inodes and the snapshot's links
+    keep the original content.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -40,6 +106,7 @@ class PatchValidator:
         self.patch_file = patch_file
         self.timeout_minutes = timeout_minutes
         self.backup_dir = None  # Will be a temp directory
+        self._tree_modified = False  # Set once a patch tool actually writes
         self.scoring_engine = ScoringEngine()
         self.results = []
     
@@ -114,69 +181,97 @@ class PatchValidator:
             self.restore_backup()
     
     def create_backup(self):
-        """Create backup of current state before applying patch."""
+        """Create backup of current state before applying patch.
+
+        A git stash/worktree snapshot would avoid even the link pass, but
+        it can't represent the state protected here: the transformed
+        sources live as uncommitted changes inside the nested clones under
+        src/, which the corpus repo doesn't track and a nested reset would
+        destroy. Hardlink snapshots cover both tracked and untracked trees.
+        """
         logger.info("Creating backup...")
         
-        # Create temporary directory for backup (FIX: backup bug)
-        self.backup_dir = tempfile.mkdtemp(prefix='benchmark_backup_')
-        
-        # Backup src directory if it exists
-        if os.path.exists('src'):
-            src_backup = os.path.join(self.backup_dir, 'src')
-            shutil.copytree('src', src_backup)
-        
-        # Backup transforms directory if it exists
-        if os.path.exists('transforms'):
-            transforms_backup = os.path.join(self.backup_dir, 'transforms')
-            shutil.copytree('transforms', transforms_backup)
-        
-        # Backup any other relevant files
-        for item in ['tasks', 'scoring']:
-            if os.path.exists(item):
-                backup_path = os.path.join(self.backup_dir, item)
-                if os.path.isfile(item):
-                    shutil.copy2(item, backup_path)
-                else:
-                    shutil.copytree(item, backup_path)
-        
+        # Snapshot into a temp directory on the same filesystem as the
+        # corpus so the trees hardlink instead of copying (FIX: backup bug)
+        self.backup_dir = tempfile.mkdtemp(prefix='benchmark_backup_', dir='.')
+
+        # EAFP: attempt each snapshot and let the errno say what the item
+        # was, instead of paying exists/isfile stats up front
+        for item in ('src', 'transforms', 'tasks', 'scoring'):
+            backup_path = os.path.join(self.backup_dir, item)
+            try:
+                shutil.copytree(item, backup_path, copy_function=_link_or_copy)
+            except FileNotFoundError:
+                continue
+            except NotADirectoryError:
+                _link_or_copy(item, backup_path)
+
         logger.info(f"Backup created successfully at {self.backup_dir}")
     
     def apply_patch_with_timeout(self) -> bool:
         """Apply the patch file to the codebase with timeout enforcement."""
         logger.info(f"Applying patch with {self.timeout_minutes}min timeout: {self.patch_file}")
-        
+
+        timeout = self.timeout_minutes * 60
         try:
-            # Use git apply first
-            result = subprocess.run(
-                ['git', 'apply', '--verbose', self.patch_file],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout_minutes * 60,
-                check=False
-            )
-            
-            if result.returncode == 0:
-                logger.info("Patch applied successfully with git apply")
-                return True
-            
-            # Try with patch command as fallback
+            # Cheap pre-flight: only a patch that passes --check reaches
+            # the real git apply, keeping the tree untouched otherwise.
+            # Streaming over stdin saves git a second open of the patch
+            # file
+            # Only returncode matters on success, so capture raw bytes and
+            # decode stderr lazily in the failure branches; stdout is never
+            # read at all
+            with open(self.patch_file, 'rb') as patch_stream:
+                check = subprocess.run(
+                    ['git', 'apply', '--check', '-'],
+                    stdin=patch_stream,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    timeout=timeout,
+                    check=False
+                )
+
+            if check.returncode == 0:
+                self._tree_modified = True
+                with open(self.patch_file, 'rb') as patch_stream:
+                    result = subprocess.run(
+                        ['git', 'apply', '--verbose', '-'],
+                        stdin=patch_stream,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        timeout=timeout,
+                        check=False
+                    )
+                if result.returncode == 0:
+                    logger.info("Patch applied successfully with git apply")
+                    return True
+                logger.error(f"git apply failed after a clean check: "
+                             f"{result.stderr.decode('utf-8', errors='replace')}")
+                return False
+
+            stderr = check.stderr.decode('utf-8', errors='replace') if check.stderr else ''
+
+            # The patch binary accepts more dialects than git and applies
+            # hunks with fuzz/offset where git apply strictly rejects, so
+            # any --check failure falls through to it
             logger.warning("Git apply failed, trying patch command...")
+            self._tree_modified = True  # patch can leave partial hunks behind
             result = subprocess.run(
                 ['patch', '-p1', '-i', self.patch_file],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout_minutes * 60,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=timeout,
                 check=False
             )
-            
+
             if result.returncode == 0:
                 logger.info("Patch applied successfully with patch command")
                 return True
             else:
                 logger.error(f"Both patch methods failed:")
-                logger.error(f"  Git apply: {result.stderr}")
+                logger.error(f"  Git apply: {stderr}")
                 return False
-        
+
         except subprocess.TimeoutExpired:
             logger.error(f"Patch application timed out after {self.timeout_minutes} minutes")
             return False
@@ -185,21 +280,66 @@ class PatchValidator:
             return False
     
     def load_tasks(self) -> List[Dict[str, Any]]:
-        """Load all benchmark tasks from YAML files."""
+        """Load all benchmark tasks from YAML files.
+
+        Prefers the module precompiled by scripts/build_task_cache.py,
+        then the consolidated JSON cache; both are keyed on the task
+        files' count and newest mtime, so warm validations do one cheap
+        load instead of N YAML parses.
+        """
+        # One scandir pass collects paths and the mtimes the cache key
+        # needs, without allocating a Path per entry
+        try:
+            with os.scandir('tasks') as entries:
+                task_files = sorted(
+                    (e.path, e.stat().st_mtime_ns) for e in entries
+                    if e.name.endswith('.yaml') and e.name != 'task_summary.json'
+                    and e.is_file(follow_symlinks=False)
+                )
+        except FileNotFoundError:
+            task_files = []
+        cache_key = f"{len(task_files)}:{max((mtime for _, mtime in task_files), default=0)}"
+
+        # Fastest path: the build-time compiled module, if fresh
+        compiled = _load_compiled_tasks(cache_key)
+        if compiled is not None:
+            logger.info(f"Loaded {len(compiled)} benchmark tasks (compiled)")
+            return compiled
+
+        try:
+            with open(_TASK_CACHE_PATH, 'rb') as f:
+                first_line, _, payload = f.read().partition(b'\n')
+            if first_line == cache_key.encode('ascii'):
+                tasks = orjson.loads(payload) if orjson is not None else json.loads(payload)
+                logger.info(f"Loaded {len(tasks)} benchmark tasks (cached)")
+                return tasks
+        except (OSError, ValueError):
+            pass  # stale or corrupt cache; reparse below
+
         tasks = []
-        task_files = Path('tasks').glob('*.yaml')
-        
-        for task_file in task_files:
-            if task_file.name == 'task_summary.json':
-                continue
-            
+        for task_path, _ in task_files:
             try:
-                with open(task_file, 'r') as f:
-                    task = yaml.safe_load(f)
+                # Bytes mode: libyaml consumes the raw stream without a
+                # separate decode pass
+                with open(task_path, 'rb') as f:
+                    task = yaml.load(f, Loader=_YamlLoader)
                     tasks.append(task)
             except Exception as e:
-                logger.error(f"Error loading task {task_file}: {e}")
-        
+                logger.error(f"Error loading task {task_path}: {e}")
+
+        # Atomically refresh the cache; best effort only
+        try:
+            tmp_path = f"{_TASK_CACHE_PATH}.tmp"
+            if orjson is not None:
+                payload = orjson.dumps(tasks)
+            else:
+                payload = json.dumps(tasks).encode('utf-8')
+            with open(tmp_path, 'wb') as f:
+                f.write(cache_key.encode('ascii') + b'\n' + payload)
+            os.rename(tmp_path, _TASK_CACHE_PATH)
+        except (OSError, TypeError) as e:
+            logger.debug(f"Failed to write task cache: {e}")
+
         logger.info(f"Loaded {len(tasks)} benchmark tasks")
         return tasks
     
@@ -207,27 +347,18 @@ class PatchValidator:
         """Calculate weighted overall score based on task difficulty."""
         if not self.results:
             return 0.0
-        
-        # Task weights from scoring rules (harder tasks worth more)
-        task_weights = {
-            'cross_file_reasoning': 1.0,   # baseline
-            'refactor_rename': 1.2,        # requires precision
-            'api_upgrade': 1.5,            # complex coordination  
-            'bug_localization': 2.0        # highest difficulty
-        }
-        
-        weighted_sum = 0.0
-        weight_sum = 0.0
-        
-        for result in self.results:
-            # Extract task type from task_id (e.g., "cross_file_reasoning_01" -> "cross_file_reasoning")
-            task_type = '_'.join(result.task_id.split('_')[:-1])
-            weight = task_weights.get(task_type, 1.0)
-            
-            weighted_sum += result.score * weight
-            weight_sum += weight
-        
-        return weighted_sum / weight_sum if weight_sum > 0 else 0.0
+
+        # The scoring engine stamps the authoritative task type onto each
+        # result, so no per-result task_id splitting is needed; fall back
+        # to parsing the id only for results from older engines
+        weights = [
+            _TASK_WEIGHTS.get(r.task_type or r.task_id.rsplit('_', 1)[0], 1.0)
+            for r in self.results
+        ]
+        weight_sum = sum(weights)
+        if weight_sum <= 0:
+            return 0.0
+        return sum(r.score * w for r, w in zip(self.results, weights)) / weight_sum
     
 
     
@@ -237,37 +368,39 @@ class PatchValidator:
             logger.warning("No backup directory found to restore from")
             return
         
+        # A rejected patch that never reached a patch tool's write phase
+        # leaves the tree untouched; dropping the snapshot is enough and
+        # saves the O(corpus-size) re-link pass
+        if not self._tree_modified:
+            logger.info("Tree unmodified; discarding backup without restore")
+            shutil.rmtree(self.backup_dir)
+            self.backup_dir = None
+            return
+
         logger.info(f"Restoring from backup: {self.backup_dir}")
-        
+
         try:
-            # Restore src directory
-            if os.path.exists(os.path.join(self.backup_dir, 'src')):
-                if os.path.exists('src'):
-                    shutil.rmtree('src')
-                shutil.copytree(os.path.join(self.backup_dir, 'src'), 'src')
-                logger.info("Restored src directory")
-            
-            # Restore transforms directory
-            if os.path.exists(os.path.join(self.backup_dir, 'transforms')):
-                if os.path.exists('transforms'):
-                    shutil.rmtree('transforms')
-                shutil.copytree(os.path.join(self.backup_dir, 'transforms'), 'transforms')
-                logger.info("Restored transforms directory")
-            
-            # Restore other backed up items
-            for item in ['tasks', 'scoring']:
+            # Re-link each backed-up tree from the snapshot. One exists
+            # check gates whether the item was backed up at all (the
+            # working copy must not be removed otherwise); the removal and
+            # the file-vs-directory cases are handled EAFP off the errno
+            for item in ('src', 'transforms', 'tasks', 'scoring'):
                 backup_item = os.path.join(self.backup_dir, item)
-                if os.path.exists(backup_item):
-                    if os.path.exists(item):
-                        if os.path.isfile(item):
-                            os.remove(item)
-                        else:
-                            shutil.rmtree(item)
-                    
-                    if os.path.isfile(backup_item):
-                        shutil.copy2(backup_item, item)
-                    else:
-                        shutil.copytree(backup_item, item)
+                if not os.path.exists(backup_item):
+                    continue
+
+                try:
+                    shutil.rmtree(item)
+                except FileNotFoundError:
+                    pass
+                except NotADirectoryError:
+                    os.remove(item)
+
+                try:
+                    shutil.copytree(backup_item, item, copy_function=_link_or_copy)
+                except NotADirectoryError:
+                    _link_or_copy(backup_item, item)
+                logger.info(f"Restored {item}")
             
             # Clean up temporary backup directory
             shutil.rmtree(self.backup_dir)
@@ -317,12 +450,12 @@ def main():
     
     # Output detailed results
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(_dumps_indented(results))
         logger.info(f"Detailed results saved to: {args.output}")
     else:
         print(f"\n📄 Detailed Results:")
-        print(json.dumps(results, indent=2))
+        print(_dumps_indented(results).decode('utf-8'))
 
 
 if __name__ == '__main__':
@@ -2,9 +2,9 @@
 Pytest configuration and shared fixtures.
 """
 
+import os
 import pytest
 import tempfile
-import shutil
 from pathlib import Path
 
 
@@ -13,23 +13,12 @@ def pytest_configure():
     pytest.mark.slow = pytest.mark.slow
 
 
-@pytest.fixture(scope="session")
-def sample_repos():
-    """Create sample repository structures for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_dir = Path(tmpdir)
-        
-        # Create Go repository
-        go_repo = base_dir / "go-repo"
-        go_repo.mkdir()
-        
-        (go_repo / "go.mod").write_text("module example.com/test\n\ngo 1.21\n")
-        
-        # Package structure
-        pkg_dir = go_repo / "pkg" / "api"
-        pkg_dir.mkdir(parents=True)
-        
-        (pkg_dir / "handler.go").write_text("""
+# Snapshot of the sample repositories, prebuilt at import time so the
+# session fixture only has to materialize it: create each directory once,
+# then one open/write/close per file.
+_SAMPLE_REPO_FILES = {
+    "go-repo/go.mod": b"module example.com/test\n\ngo 1.21\n",
+    "go-repo/pkg/api/handler.go": b"""
 package api
 
 import (
@@ -55,9 +44,8 @@ type RequestHandler struct {
 func (h *RequestHandler) Handle(req *http.Request) string {
     return h.config.Process(req.URL.String())
 }
-""")
-        
-        (pkg_dir / "config.go").write_text("""
+""",
+    "go-repo/pkg/api/config.go": b"""
 package api
 
 type Config struct {
@@ -71,23 +59,13 @@ func (c *Config) Process(input string) string {
     }
     return input
 }
-""")
-        
-        # Create Python repository
-        py_repo = base_dir / "python-repo"
-        py_repo.mkdir()
-        
-        (py_repo / "setup.py").write_text("""
+""",
+    "python-repo/setup.py": b"""
 from setuptools import setup
 setup(name='test-package', version='1.0.0')
-""")
-        
-        src_dir = py_repo / "src" / "mypackage"
-        src_dir.mkdir(parents=True)
-        
-        (src_dir / "__init__.py").write_text("")
-        
-        (src_dir / "handlers.py").write_text("""
+""",
+    "python-repo/src/mypackage/__init__.py": b"",
+    "python-repo/src/mypackage/handlers.py": b"""
 import json
 from typing import Dict, Any
 
@@ -95,13 +73,13 @@ from typing import Dict, Any
 class RequestProcessor:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-    
+
     def process_request(self, data: str) -> str:
         '''Process incoming request data.'''
         if self.config.get('debug'):
             return f"debug: {data}"
         return self.transform_data(data)
-    
+
     def transform_data(self, data: str) -> str:
         return f"transformed-{data}"
 
@@ -110,23 +88,40 @@ def handle_api_call(endpoint: str, payload: Dict) -> Dict:
     processor = RequestProcessor({'debug': True})
     result = processor.process_request(json.dumps(payload))
     return {'status': 'ok', 'result': result}
-""")
-        
-        (src_dir / "utils.py").write_text("""
+""",
+    "python-repo/src/mypackage/utils.py": b"""
 def format_response(data):
     return {'formatted': data, 'timestamp': '2023-01-01'}
 
 class Logger:
     def __init__(self, level='INFO'):
         self.level = level
-    
+
     def log(self, message):
         print(f"[{self.level}] {message}")
-""")
-        
+""",
+}
+
+
+@pytest.fixture(scope="session")
+def sample_repos():
+    """Create sample repository structures for testing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base_dir = Path(tmpdir)
+
+        for parent in {Path(rel).parent for rel in _SAMPLE_REPO_FILES}:
+            (base_dir / parent).mkdir(parents=True, exist_ok=True)
+
+        for rel, payload in _SAMPLE_REPO_FILES.items():
+            fd = os.open(base_dir / rel, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+
         yield {
-            'go_repo': go_repo,
-            'python_repo': py_repo,
+            'go_repo': base_dir / "go-repo",
+            'python_repo': base_dir / "python-repo",
             'base_dir': base_dir
         }
 